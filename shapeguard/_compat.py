@@ -7,6 +7,7 @@ and other array-like objects without importing them at module level.
 
 from __future__ import annotations
 
+from collections.abc import Callable
 from typing import Any
 
 
@@ -31,9 +32,15 @@ def get_shape(x: Any) -> tuple[int, ...]:
             f"Cannot get shape from {type(x).__name__!r}: object has no 'shape' attribute"
         )
 
-    # Convert to tuple of ints to handle JAX's traced shapes
-    # and numpy's np.int64 dimension values
-    return tuple(int(d) for d in x.shape)
+    shape = x.shape
+
+    # Fast path: NumPy (and most JAX) shapes are already tuples of ints
+    if type(shape) is tuple and all(type(d) is int for d in shape):
+        return shape
+
+    # Convert to tuple of ints to handle JAX's traced shapes,
+    # torch.Size, and numpy's np.int64 dimension values
+    return tuple(int(d) for d in shape)
 
 
 def is_array(x: Any) -> bool:
@@ -46,6 +53,15 @@ def is_array(x: Any) -> bool:
     return hasattr(x, "shape") and hasattr(x, "dtype")
 
 
+# Top-level module name -> array backend
+_BACKEND_MAP = {
+    "numpy": "numpy",
+    "jax": "jax",
+    "jaxlib": "jax",  # concrete JAX arrays are defined in jaxlib
+    "torch": "torch",
+}
+
+
 def get_array_backend(x: Any) -> str:
     """
     Detect which array backend x belongs to.
@@ -53,16 +69,41 @@ def get_array_backend(x: Any) -> str:
     Returns:
         One of: "numpy", "jax", "torch", "unknown"
     """
-    module = type(x).__module__
+    return _BACKEND_MAP.get(type(x).__module__.partition(".")[0], "unknown")
+
+
+# Constant probe used when JAX (or its tracer API) is unavailable
+_FALSE: Callable[[], bool] = (False).__bool__
+
+
+def _load_tracer_probe() -> Callable[[], bool]:
+    """Look up JAX's tracer probe, or `_FALSE` if it is unavailable."""
+    if not is_jax_installed():
+        return _FALSE
+
+    try:
+        from jax._src.core import unsafe_am_i_under_a_jit
+    except Exception:
+        # JAX internals changed - assume never tracing
+        return _FALSE
 
-    if module.startswith("numpy"):
-        return "numpy"
-    elif module.startswith("jax"):
-        return "jax"
-    elif module.startswith("torch"):
-        return "torch"
-    else:
-        return "unknown"
+    probe: Callable[[], bool] = unsafe_am_i_under_a_jit
+    return probe
+
+
+def _bootstrap_tracer_probe() -> bool:
+    """Resolve the tracer probe on first use and rebind `_tracer_probe` to it."""
+    global _tracer_probe
+
+    _tracer_probe = _load_tracer_probe()
+    return bool(_tracer_probe())
+
+
+# Zero-argument callable returning True under JAX tracing. Starts as a
+# bootstrap so JAX is only imported when first needed; afterwards it is
+# JAX's probe itself (or `_FALSE`). Access it as `_compat._tracer_probe`,
+# since importing the name would pin the bootstrap.
+_tracer_probe: Callable[[], bool] = _bootstrap_tracer_probe
 
 
 def is_jax_tracing() -> bool:
@@ -75,22 +116,23 @@ def is_jax_tracing() -> bool:
 
     Note:
         Uses JAX's internal `unsafe_am_i_under_a_jit` function to detect
-        if we're inside a traced context.
+        if we're inside a traced context. The lookup happens once; later
+        calls go straight to the cached probe.
     """
-    try:
-        from jax._src.core import unsafe_am_i_under_a_jit
+    return bool(_tracer_probe())
 
-        return bool(unsafe_am_i_under_a_jit())
-    except ImportError:
-        # JAX not installed or API changed
-        return False
-    except Exception:
-        # JAX internals changed or other error - assume not tracing
-        return False
+
+# Cached result of is_jax_installed(); None until first queried
+_JAX_INSTALLED: bool | None = None
 
 
 def is_jax_installed() -> bool:
-    """Check if JAX is available."""
-    from importlib.util import find_spec
+    """Check if JAX is available (the answer is cached after the first call)."""
+    global _JAX_INSTALLED
+
+    if _JAX_INSTALLED is None:
+        from importlib.util import find_spec
+
+        _JAX_INSTALLED = find_spec("jax") is not None
 
-    return find_spec("jax") is not None
+    return _JAX_INSTALLED
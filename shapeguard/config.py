@@ -4,11 +4,19 @@ Global configuration for ShapeGuard.
 
 from __future__ import annotations
 
+import os
+import sys
 from typing import Literal
 
 JitMode = Literal["check", "warn", "skip"]
 
 
+def _disabled_from_environment() -> bool:
+    """Whether checks are switched off for this process (read once at import)."""
+    flag = os.environ.get("SHAPEGUARD_DISABLE", "").strip().lower()
+    return flag in ("1", "true", "yes") or sys.flags.optimize >= 2
+
+
 class Config:
     """
     Global ShapeGuard configuration.
@@ -18,6 +26,10 @@ class Config:
             - "check": Always validate, raise on mismatch (default)
             - "warn": Validate, log warning on mismatch, continue
             - "skip": Skip validation entirely under JIT
+        disabled: Read-only. True if shape checking is compiled out for
+            this process, which happens when the SHAPEGUARD_DISABLE
+            environment variable is "1", "true" or "yes" or
+            Python runs with -OO. Decided once, at import time.
 
     Example:
         from shapeguard import config
@@ -25,10 +37,16 @@ class Config:
         config.jit_mode = "skip"  # Disable checks under JIT globally
     """
 
-    __slots__ = ("_jit_mode",)
+    __slots__ = ("_jit_mode", "_disabled")
 
     def __init__(self) -> None:
         self._jit_mode: JitMode = "check"
+        self._disabled = _disabled_from_environment()
+
+    @property
+    def disabled(self) -> bool:
+        """Whether shape checking is disabled for this process."""
+        return self._disabled
 
     @property
     def jit_mode(self) -> JitMode:
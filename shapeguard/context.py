@@ -8,7 +8,6 @@ from typing import Any
 
 from shapeguard._compat import get_shape
 from shapeguard.core import UnificationContext
-from shapeguard.errors import ShapeGuardError
 from shapeguard.spec import ShapeSpec, match_shape
 
 
@@ -70,11 +69,7 @@ class ShapeContext:
         """
         actual = get_shape(x)
 
-        try:
-            match_shape(actual, spec, self._ctx, name)
-        except ShapeGuardError as e:
-            e.argument = name
-            raise
+        match_shape(actual, spec, self._ctx, name)
 
         return self
 
@@ -35,12 +35,9 @@ class Dim:
     def __repr__(self) -> str:
         return self.name
 
-    def __eq__(self, other: object) -> bool:
-        # Identity-based equality
-        return self is other
-
-    def __hash__(self) -> int:
-        return id(self)
+    # Equality and hashing are object identity. The defaults inherited from
+    # object already do this in C, so Dim keys hash without calling back
+    # into Python (bindings lookups and the spec parse cache rely on this).
 
 
 class Batch(Dim):
@@ -76,11 +73,19 @@ class _EllipsisType:
 
     __slots__ = ()
 
+    _instance: _EllipsisType | None = None
+
+    def __new__(cls) -> _EllipsisType:
+        # Always the singleton, so specs can test for it by identity
+        if _EllipsisType._instance is None:
+            _EllipsisType._instance = super().__new__(cls)
+        return _EllipsisType._instance
+
     def __repr__(self) -> str:
         return "..."
 
     def __eq__(self, other: object) -> bool:
-        return isinstance(other, _EllipsisType) or other is ...
+        return other is self or other is ...
 
     def __hash__(self) -> int:
         return hash(...)
@@ -96,7 +101,15 @@ class Binding:
     """Record of a dimension binding with source info for error messages."""
 
     value: int
-    source: str  # e.g., "x.shape[1]"
+    origin: str  # e.g., "x.shape[1]", or "x" together with an index
+    index: int | None = None  # dimension index within origin, if any
+
+    @property
+    def source(self) -> str:
+        """Where the binding came from (formatted lazily), e.g. "x[1]"."""
+        if self.index is None:
+            return self.origin
+        return f"{self.origin}[{self.index}]"
 
 
 class UnificationContext:
@@ -112,7 +125,7 @@ class UnificationContext:
     def __init__(self) -> None:
         self.bindings: dict[Dim, Binding] = {}
 
-    def bind(self, dim: Dim, value: int, source: str) -> None:
+    def bind(self, dim: Dim, value: int, source: str, index: int | None = None) -> None:
         """
         Bind a dimension to a concrete value.
 
@@ -120,24 +133,28 @@ class UnificationContext:
             dim: The symbolic dimension to bind
             value: The concrete integer value
             source: Description of where this binding came from (e.g., "x.shape[0]")
+            index: Optional dimension index within source; if given, the
+                binding is reported as "source[index]" and source is taken
+                to name the checked array (stamped as the error's argument).
+                Formatting is deferred until the description is needed.
 
         Raises:
             UnificationError: If dim is already bound to a different value
         """
-        from shapeguard.errors import UnificationError
-
-        if dim in self.bindings:
-            existing = self.bindings[dim]
-            if existing.value != value:
-                raise UnificationError(
-                    dim=dim,
-                    expected_value=existing.value,
-                    expected_source=existing.source,
-                    actual_value=value,
-                    actual_source=source,
-                )
-        else:
-            self.bindings[dim] = Binding(value=value, source=source)
+        existing = self.bindings.get(dim)
+        if existing is None:
+            self.bindings[dim] = Binding(value=value, origin=source, index=index)
+        elif existing.value != value:
+            from shapeguard.errors import UnificationError
+
+            raise UnificationError(
+                dim=dim,
+                expected_value=existing.value,
+                expected_source=existing.source,
+                actual_value=value,
+                actual_source=source if index is None else f"{source}[{index}]",
+                argument=None if index is None else source,
+            )
 
     def resolve(self, dim: Dim) -> int | None:
         """
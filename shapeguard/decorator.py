@@ -14,7 +14,7 @@ from shapeguard._compat import get_shape, is_array, is_jax_tracing
 from shapeguard.config import JitMode, config
 from shapeguard.core import UnificationContext
 from shapeguard.errors import ShapeGuardError
-from shapeguard.spec import ShapeSpec, match_shape
+from shapeguard.spec import ShapeSpec, _compile_spec, match_shape
 
 F = TypeVar("F", bound=Callable[..., Any])
 
@@ -127,6 +127,9 @@ def expects(
         @expects(x=(n, m), jit_mode="skip")
         @jax.jit
         def fast_layer(x): ...
+
+    If `config.disabled` is set (SHAPEGUARD_DISABLE or python -OO), the
+    function is returned unwrapped and no checks run.
     """
 
     def decorator(fn: F) -> F:
@@ -143,6 +146,17 @@ def expects(
                     f"Valid parameters: {sorted(param_names)}"
                 )
 
+        if config.disabled:
+            # Checking is compiled out: hand back the function unwrapped
+            return fn
+
+        # Specialize a matcher for each plain shape spec once, up front
+        matchers = {
+            arg_name: _compile_spec(spec)
+            for arg_name, spec in shape_specs.items()
+            if not isinstance(spec, dict)
+        }
+
         @functools.wraps(fn)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Determine effective JIT mode
@@ -180,7 +194,7 @@ def expects(
                             continue
 
                         actual = get_shape(value)
-                        match_shape(actual, spec, ctx, arg_name)
+                        matchers[arg_name](actual, ctx, arg_name)
 
                 except ShapeGuardError as e:
                     # Enrich error with function context
@@ -10,6 +10,16 @@ if TYPE_CHECKING:
     from shapeguard.core import Dim
 
 
+def _restore_error(cls: type[ShapeGuardError], args: tuple[Any, ...], state: dict[str, Any]) -> Any:
+    """Rebuild a pickled/copied error without re-running its __init__."""
+    err = cls.__new__(cls, *args)
+    Exception.__init__(err, *args)
+    err._str_cache = None
+    for name, value in state.items():
+        setattr(err, name, value)
+    return err
+
+
 class ShapeGuardError(Exception):
     """
     Base exception for shape contract violations.
@@ -18,6 +28,16 @@ class ShapeGuardError(Exception):
     without re-running code.
     """
 
+    __slots__ = (
+        "function",
+        "argument",
+        "expected",
+        "actual",
+        "reason",
+        "bindings",
+        "_str_cache",
+    )
+
     def __init__(
         self,
         message: str,
@@ -35,9 +55,35 @@ class ShapeGuardError(Exception):
         self.actual = actual
         self.reason = reason
         self.bindings = bindings
+        # (fields, text) from the last __str__ call; the fields are compared
+        # on reuse because the decorator fills some of them in after raising
+        self._str_cache: tuple[tuple[Any, ...], str] | None = None
         super().__init__(message)
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException.__reduce__ only saves args and __dict__, which would
+        # drop the slot fields; subclass __init__ signatures also differ, so
+        # restore from args plus the collected state instead
+        state = dict(getattr(self, "__dict__", None) or {})
+        for klass in type(self).__mro__:
+            for name in getattr(klass, "__slots__", ()):
+                if name != "_str_cache" and hasattr(self, name):
+                    state[name] = getattr(self, name)
+        return (_restore_error, (type(self), self.args, state))
+
     def __str__(self) -> str:
+        fields = (
+            self.function,
+            self.argument,
+            self.expected,
+            self.actual,
+            self.reason,
+            self.bindings,
+        )
+        cached = self._str_cache
+        if cached is not None and cached[0] == fields:
+            return cached[1]
+
         lines = ["ShapeGuardError:"]
         if self.function:
             lines.append(f"  function: {self.function}")
@@ -51,13 +97,16 @@ class ShapeGuardError(Exception):
             lines.append(f"  reason:   {self.reason}")
         if self.bindings:
             lines.append(f"  bindings: {self.bindings}")
-        return "\n".join(lines)
+
+        text = "\n".join(lines)
+        self._str_cache = (fields, text)
+        return text
 
     @staticmethod
     def _format_shape(shape: Any) -> str:
         """Format a shape spec or tuple for display."""
         if isinstance(shape, tuple):
-            return "(" + ", ".join(str(d) for d in shape) + ")"
+            return "(" + ", ".join(map(str, shape)) + ")"
         return str(shape)
 
 
@@ -69,6 +118,14 @@ class UnificationError(ShapeGuardError):
     integer values across arguments.
     """
 
+    __slots__ = (
+        "dim",
+        "expected_value",
+        "expected_source",
+        "actual_value",
+        "actual_source",
+    )
+
     def __init__(
         self,
         dim: Dim,
@@ -76,6 +133,8 @@ class UnificationError(ShapeGuardError):
         expected_source: str,
         actual_value: int,
         actual_source: str,
+        *,
+        argument: str | None = None,
     ) -> None:
         self.dim = dim
         self.expected_value = expected_value
@@ -89,6 +148,7 @@ class UnificationError(ShapeGuardError):
         )
         super().__init__(
             reason,
+            argument=argument,
             reason=reason,
         )
 
@@ -96,6 +156,8 @@ class UnificationError(ShapeGuardError):
 class RankMismatchError(ShapeGuardError):
     """Raised when array rank (number of dimensions) doesn't match spec."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -122,6 +184,8 @@ class RankMismatchError(ShapeGuardError):
 class DimensionMismatchError(ShapeGuardError):
     """Raised when a specific dimension doesn't match the expected value."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         *,
@@ -149,6 +213,8 @@ class DimensionMismatchError(ShapeGuardError):
 class BroadcastError(ShapeGuardError):
     """Raised when shapes cannot be broadcast together."""
 
+    __slots__ = ("shapes", "dim_index", "dim_values")
+
     def __init__(
         self,
         shapes: list[tuple[int, ...]],
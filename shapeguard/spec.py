@@ -4,14 +4,17 @@ Shape specification parsing and matching.
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
 from typing import Any
 
+from shapeguard import _compat
 from shapeguard._compat import get_shape
-from shapeguard.core import Dim, UnificationContext, _EllipsisType
+from shapeguard.config import config
+from shapeguard.core import ELLIPSIS, Dim, UnificationContext, _EllipsisType
 from shapeguard.errors import (
     DimensionMismatchError,
     RankMismatchError,
-    ShapeGuardError,
 )
 
 # Type alias for shape specifications
@@ -20,38 +23,95 @@ from shapeguard.errors import (
 ShapeSpec = tuple[int | Dim | None | _EllipsisType, ...]
 
 
-def _has_ellipsis(spec: ShapeSpec) -> bool:
-    """Check if spec contains an ellipsis."""
-    return any(s is ... or isinstance(s, _EllipsisType) for s in spec)
+# Kind codes for parsed spec elements
+_WILDCARD = 0  # None: accept any value
+_SYMBOLIC = 1  # Dim: unify with context
+_CONCRETE = 2  # int: must match exactly
 
+# A parsed run of spec elements (no ellipsis): (kind, payload) pairs
+SpecPart = tuple[tuple[int, int | Dim | None], ...]
 
-# Type alias for spec parts without ellipsis
-SpecPart = tuple[int | Dim | None, ...]
+# Layout codes for parsed specs, used to pick a matching strategy
+_ALL_CONCRETE = 0  # only ints: matching is tuple equality
+_MIXED = 1  # no ellipsis, but some Dim or None elements
+_HAS_ELLIPSIS = 2  # variable-rank spec
 
 
-def _filter_ellipsis(items: ShapeSpec) -> SpecPart:
-    """Filter out ellipsis from spec items."""
-    return tuple(s for s in items if not (s is ... or isinstance(s, _EllipsisType)))
+# Parsed spec: (layout, before, after, concrete); see _parse_spec
+ParsedSpec = tuple[int, SpecPart, SpecPart, tuple[int, ...]]
 
 
-def _split_ellipsis_spec(spec: ShapeSpec) -> tuple[SpecPart, SpecPart]:
+def _parse_spec(spec: ShapeSpec) -> ParsedSpec:
     """
-    Split a spec at the ellipsis into (before, after) parts.
+    Split a spec at the ellipsis and tag each element with its kind.
 
-    The returned tuples do not contain ellipsis elements.
+    Specs are usually constants, so callers go through `_get_parsed_spec`,
+    which caches the result per spec; bindings stay per-call in the context.
 
-    Raises ValueError if more than one ellipsis.
+    Returns:
+        (layout, before, after, concrete). Without an ellipsis, `before`
+        holds the whole spec and `after` is empty. Each part is a tuple of
+        (kind, payload) pairs and contains no ellipsis elements. For the
+        _ALL_CONCRETE layout, `concrete` is the spec as a tuple of ints;
+        otherwise it is empty.
+
+    Raises:
+        ValueError: If the spec contains more than one ellipsis
+        TypeError: If a spec element is not int, Dim, None, or ...
     """
-    ellipsis_indices = [i for i, s in enumerate(spec) if s is ... or isinstance(s, _EllipsisType)]
+    has_ellipsis = False
+    before: list[tuple[int, int | Dim | None]] = []
+    after: list[tuple[int, int | Dim | None]] = []
+
+    for i, s in enumerate(spec):
+        if s is ... or s is ELLIPSIS:
+            if has_ellipsis:
+                raise ValueError("Shape spec cannot contain more than one ellipsis")
+            has_ellipsis = True
+            continue
+
+        if s is None:
+            kind = _WILDCARD
+        elif isinstance(s, Dim):
+            kind = _SYMBOLIC
+        elif isinstance(s, int):
+            kind = _CONCRETE
+        else:
+            raise TypeError(
+                f"Invalid spec element at position {i}: {s!r} (expected int, Dim, None, or ...)"
+            )
 
-    if len(ellipsis_indices) > 1:
-        raise ValueError("Shape spec cannot contain more than one ellipsis")
+        (after if has_ellipsis else before).append((kind, s))
 
-    if not ellipsis_indices:
-        return _filter_ellipsis(spec), ()
+    if has_ellipsis:
+        return _HAS_ELLIPSIS, tuple(before), tuple(after), ()
+    if all(kind == _CONCRETE for kind, _ in before):
+        # An all-int tuple spec already is the concrete shape; don't copy it
+        concrete = spec if type(spec) is tuple else tuple(s for _, s in before)
+        return _ALL_CONCRETE, tuple(before), (), concrete  # type: ignore
+    return _MIXED, tuple(before), (), ()
 
-    idx = ellipsis_indices[0]
-    return _filter_ellipsis(spec[:idx]), _filter_ellipsis(spec[idx + 1 :])
+
+@functools.lru_cache(maxsize=1024)
+def _parse_spec_cached(spec: ShapeSpec, types: tuple[type, ...]) -> ParsedSpec:
+    """
+    Cached `_parse_spec`.
+
+    `types` holds the element types and only serves as part of the cache
+    key: lru_cache compares keys with ==, so (3, 4) and (3.0, 4) would
+    otherwise share an entry and validation would depend on cache state.
+    """
+    return _parse_spec(spec)
+
+
+def _get_parsed_spec(spec: ShapeSpec) -> ParsedSpec:
+    """Parse a spec, using the cache when the spec is hashable."""
+    try:
+        return _parse_spec_cached(spec, tuple(map(type, spec)))
+    except TypeError:
+        # Unhashable spec (e.g. a list), or an invalid element: parse
+        # without caching (which raises for invalid elements)
+        return _parse_spec(spec)
 
 
 def match_shape(
@@ -69,6 +129,8 @@ def match_shape(
         ctx: Unification context for tracking dimension bindings
         source: Description of where this shape came from (for error messages)
 
+    Errors raised here carry `source` as their `argument`.
+
     Raises:
         RankMismatchError: If the number of dimensions doesn't match
         DimensionMismatchError: If a concrete dimension doesn't match
@@ -79,13 +141,20 @@ def match_shape(
         match_shape((2, 3, 4), (..., n, m), ctx, "x")  # ellipsis matches (2,)
         match_shape((3, 4), (..., n, m), ctx, "x")     # ellipsis matches ()
     """
+    layout, before, after, concrete = _get_parsed_spec(spec)
+
+    # Concrete spec: a single tuple comparison decides the common case;
+    # on mismatch, fall through to locate the offending dimension
+    if layout == _ALL_CONCRETE and actual == concrete:
+        return
+
     # Handle ellipsis in spec
-    if _has_ellipsis(spec):
-        before, after = _split_ellipsis_spec(spec)
+    if layout == _HAS_ELLIPSIS:
         required_dims = len(before) + len(after)
 
         if len(actual) < required_dims:
             raise RankMismatchError(
+                argument=source,
                 expected_rank=f"{required_dims}+",  # "2+" means at least 2
                 actual_rank=len(actual),
                 expected_shape=spec,
@@ -93,72 +162,156 @@ def match_shape(
                 bindings=ctx.format_bindings(),
             )
 
-        # Match the 'before' part (leading fixed dims)
-        for i, spec_dim in enumerate(before):
-            _match_dim(actual[i], spec_dim, i, actual, spec, ctx, source)
+        # Match the 'before' part (leading fixed dims); specs like
+        # (..., n, m) or (n, ...) leave one part empty, so skip it
+        if before:
+            _match_part(actual, before, 0, spec, ctx, source)
 
         # Match the 'after' part (trailing fixed dims)
         # These align from the end
-        offset = len(actual) - len(after)
-        for i, spec_dim in enumerate(after):
-            actual_idx = offset + i
-            _match_dim(actual[actual_idx], spec_dim, actual_idx, actual, spec, ctx, source)
-
+        if after:
+            _match_part(actual, after, len(actual) - len(after), spec, ctx, source)
         return
 
     # No ellipsis: require exact rank match
-    if len(actual) != len(spec):
+    if len(actual) != len(before):
         raise RankMismatchError(
-            expected_rank=len(spec),
+            argument=source,
+            expected_rank=len(before),
             actual_rank=len(actual),
             expected_shape=spec,
             actual_shape=actual,
             bindings=ctx.format_bindings(),
         )
 
-    # Check each dimension (filter for type narrowing, no ellipsis present)
-    spec_dims = _filter_ellipsis(spec)
-    for i, spec_dim in enumerate(spec_dims):
-        _match_dim(actual[i], spec_dim, i, actual, spec, ctx, source)
+    # Check each dimension (`before` is the whole spec here)
+    _match_part(actual, before, 0, spec, ctx, source)
 
 
-def _match_dim(
-    actual_dim: int,
-    spec_dim: int | Dim | None,
-    index: int,
-    actual_shape: tuple[int, ...],
+def _match_part(
+    actual: tuple[int, ...],
+    part: SpecPart,
+    offset: int,
     spec: ShapeSpec,
     ctx: UnificationContext,
     source: str,
 ) -> None:
-    """Match a single dimension against its spec."""
-    dim_source = f"{source}[{index}]"
+    """Match a parsed spec part against `actual` starting at `offset`."""
+    for i, (kind, payload) in enumerate(part, offset):
+        if kind == _CONCRETE:
+            # Concrete dimension: must match exactly
+            if actual[i] != payload:
+                raise DimensionMismatchError(
+                    argument=source,
+                    dim_index=i,
+                    expected_value=payload,  # type: ignore
+                    actual_value=actual[i],
+                    expected_shape=spec,
+                    actual_shape=actual,
+                    bindings=ctx.format_bindings(),
+                )
+        elif kind == _SYMBOLIC:
+            # Symbolic dimension: unify with context
+            ctx.bind(payload, actual[i], source, i)  # type: ignore
+        # else wildcard: accept any value
+
+
+# A compiled matcher: (actual, ctx, source) -> None, raising like match_shape
+Matcher = Callable[[tuple[int, ...], UnificationContext, str], None]
+
+
+def _compile_spec(spec: ShapeSpec) -> Matcher:
+    """
+    Build a matcher specialized to one spec.
 
-    if spec_dim is None:
-        # Wildcard: accept any value
-        return
+    For fixed specs (e.g. those given to @expects), this emits straight-line
+    code with the rank and concrete dims inlined, e.g. for (n, 128):
 
-    elif isinstance(spec_dim, Dim):
-        # Symbolic dimension: unify with context
-        ctx.bind(spec_dim, actual_dim, dim_source)
-
-    elif isinstance(spec_dim, int):
-        # Concrete dimension: must match exactly
-        if actual_dim != spec_dim:
-            raise DimensionMismatchError(
-                dim_index=index,
-                expected_value=spec_dim,
-                actual_value=actual_dim,
-                expected_shape=spec,
-                actual_shape=actual_shape,
-                bindings=ctx.format_bindings(),
-            )
+        def _check(actual, ctx, source):
+            if len(actual) != 2 or actual[1] != 128:
+                return match_shape(actual, _spec, ctx, source)
+            ctx.bind(_d0, actual[0], source, 0)
+
+    Any rank or concrete mismatch defers to match_shape, which re-checks in
+    spec order and raises the same error it always would. Symbolic dims are
+    only bound once all concrete checks passed, so the order of bindings and
+    errors matches match_shape exactly.
+
+    The generated code is cached per spec (keyed on element types too), but
+    each call gets its own matcher closing over the caller's `spec`, so
+    errors always report the spec object that was passed in.
 
+    Unhashable specs (e.g. lists) get a plain wrapper around match_shape.
+
+    Raises:
+        ValueError: If the spec contains more than one ellipsis
+        TypeError: If a spec element is not int, Dim, None, or ...
+    """
+    try:
+        make_matcher = _compile_spec_cached(spec, tuple(map(type, spec)))
+    except TypeError:
+        make_matcher = None
+
+    if make_matcher is not None:
+        return make_matcher(spec)
+
+    _parse_spec(spec)  # raise for invalid elements
+
+    def _check(actual: tuple[int, ...], ctx: UnificationContext, source: str) -> None:
+        match_shape(actual, spec, ctx, source)
+
+    return _check
+
+
+@functools.lru_cache(maxsize=1024)
+def _compile_spec_cached(
+    spec: ShapeSpec, types: tuple[type, ...]
+) -> Callable[[ShapeSpec], Matcher]:
+    """
+    Generate and exec the specialized matcher code for a hashable spec.
+
+    Returns a factory taking the caller's spec (used for error reporting).
+    `types` only keys the cache, as in `_parse_spec_cached`.
+    """
+    layout, before, after, concrete = _parse_spec(spec)
+    namespace: dict[str, Any] = {"match_shape": match_shape}
+    lines = ["def _make(_spec):", "    def _check(actual, ctx, source):"]
+
+    if layout == _ALL_CONCRETE:
+        lines.append(f"        if actual != {tuple(int(d) for d in concrete)!r}:")
+        lines.append("            return match_shape(actual, _spec, ctx, source)")
     else:
-        raise TypeError(
-            f"Invalid spec element at position {index}: {spec_dim!r} "
-            f"(expected int, Dim, None, or ...)"
-        )
+        # Index expressions (into actual) for each element of each part
+        indexed: list[tuple[str, str, tuple[int, int | Dim | None]]] = []
+        if layout == _HAS_ELLIPSIS:
+            lines.append("        r = len(actual)")
+            conditions = [f"r < {len(before) + len(after)}"]
+            indexed += [(f"{i}", f"{i}", item) for i, item in enumerate(before)]
+            indexed += [
+                (f"-{len(after) - j}", f"r - {len(after) - j}", item)
+                for j, item in enumerate(after)
+            ]
+        else:
+            conditions = [f"len(actual) != {len(before)}"]
+            indexed += [(f"{i}", f"{i}", item) for i, item in enumerate(before)]
+
+        binds: list[str] = []
+        for subscript, index, (kind, payload) in indexed:
+            if kind == _CONCRETE:
+                conditions.append(f"actual[{subscript}] != {int(payload)!r}")  # type: ignore
+            elif kind == _SYMBOLIC:
+                name = f"_d{len(binds)}"
+                namespace[name] = payload
+                binds.append(f"        ctx.bind({name}, actual[{subscript}], source, {index})")
+
+        lines.append(f"        if {' or '.join(conditions)}:")
+        lines.append("            return match_shape(actual, _spec, ctx, source)")
+        lines.extend(binds)
+
+    lines.append("    return _check")
+    code = compile("\n".join(lines), f"<shapeguard spec {format_spec(spec)}>", "exec")
+    exec(code, namespace)
+    return namespace["_make"]  # type: ignore
 
 
 def check_shape(
@@ -182,6 +335,9 @@ def check_shape(
     Returns:
         The unification context (useful for chaining checks)
 
+    Under JAX tracing with `config.jit_mode == "skip"`, the check is skipped
+    and the context is returned unchanged.
+
     Raises:
         ShapeGuardError: If shape doesn't match specification
 
@@ -195,14 +351,12 @@ def check_shape(
     if ctx is None:
         ctx = UnificationContext()
 
+    if config.jit_mode == "skip" and _compat._tracer_probe():
+        return ctx
+
     actual = get_shape(x)
 
-    try:
-        match_shape(actual, spec, ctx, name)
-    except ShapeGuardError as e:
-        # Add name context to error
-        e.argument = name
-        raise
+    match_shape(actual, spec, ctx, name)
 
     return ctx
 
@@ -213,7 +367,7 @@ def format_spec(spec: ShapeSpec) -> str:
     def fmt_dim(d: int | Dim | None | _EllipsisType) -> str:
         if d is None:
             return "*"
-        elif d is ... or isinstance(d, _EllipsisType):
+        elif d is ... or d is ELLIPSIS:
             return "..."
         elif isinstance(d, Dim):
             return d.name
@@ -221,3 +375,27 @@ def format_spec(spec: ShapeSpec) -> str:
             return str(d)
 
     return "(" + ", ".join(fmt_dim(d) for d in spec) + ")"
+
+
+if config.disabled:
+    # Production escape hatch: replace the checking entry points with no-ops
+    # at import, so callers (and modules importing these names) pay nothing.
+
+    def match_shape(  # noqa: F811
+        actual: tuple[int, ...],
+        spec: ShapeSpec,
+        ctx: UnificationContext,
+        source: str,
+    ) -> None:
+        """No-op: shape checking is disabled (see `config.disabled`)."""
+        return None
+
+    def check_shape(  # noqa: F811
+        x: Any,
+        spec: ShapeSpec,
+        name: str = "array",
+        *,
+        ctx: UnificationContext | None = None,
+    ) -> UnificationContext:
+        """No-op: shape checking is disabled (see `config.disabled`)."""
+        return ctx if ctx is not None else UnificationContext()
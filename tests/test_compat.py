@@ -0,0 +1,40 @@
+"""
+Tests for shapeguard._compat module.
+"""
+
+import pytest
+
+from shapeguard._compat import get_shape
+from tests.conftest import requires_numpy
+
+
+class _Shaped:
+    def __init__(self, shape):
+        self.shape = shape
+
+
+class TestGetShape:
+    """Tests for the get_shape function."""
+
+    def test_int_tuple_returned_as_is(self):
+        shape = (3, 4)
+        assert get_shape(_Shaped(shape)) is shape
+
+    def test_empty_shape(self):
+        assert get_shape(_Shaped(())) == ()
+
+    @requires_numpy
+    def test_non_int_dims_converted(self):
+        """Every dim is converted, not just the first."""
+        import numpy as np
+
+        shape = get_shape(_Shaped((3, np.int64(4))))
+        assert shape == (3, 4)
+        assert all(type(d) is int for d in shape)
+
+    def test_non_tuple_shape_converted(self):
+        assert get_shape(_Shaped([3, 4])) == (3, 4)
+
+    def test_missing_shape_raises(self):
+        with pytest.raises(TypeError):
+            get_shape(object())
@@ -2,8 +2,14 @@
 Tests for ShapeGuard configuration.
 """
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
+import shapeguard
 from shapeguard import config
 from shapeguard.config import Config
 
@@ -59,3 +65,38 @@ class TestConfig:
             assert config.jit_mode == "skip"
         finally:
             config.jit_mode = original
+
+
+class TestDisabled:
+    """Tests for disabling shape checking via the environment."""
+
+    def test_enabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("SHAPEGUARD_DISABLE", raising=False)
+        assert Config().disabled is (sys.flags.optimize >= 2)
+
+    @pytest.mark.parametrize("value", ["1", "true", "yes", "TRUE"])
+    def test_env_var_disables(self, monkeypatch, value):
+        monkeypatch.setenv("SHAPEGUARD_DISABLE", value)
+        assert Config().disabled is True
+
+    @pytest.mark.parametrize("value", ["", "0", "false", "no", "off", "disable"])
+    def test_env_var_falsy_values(self, monkeypatch, value):
+        monkeypatch.setenv("SHAPEGUARD_DISABLE", value)
+        assert Config().disabled is (sys.flags.optimize >= 2)
+
+    def test_disabled_process_skips_checks(self):
+        """With SHAPEGUARD_DISABLE set at import, checks become no-ops."""
+        code = (
+            "from shapeguard import Dim, check_shape, expects\n"
+            "class A:\n"
+            "    shape = (2, 2)\n"
+            "    dtype = 'f'\n"
+            "def f(x):\n"
+            "    return x\n"
+            "assert expects(x=(Dim('n'), 3))(f) is f\n"
+            "check_shape(A(), (5,))\n"
+        )
+        # Make the child import this checkout regardless of pytest's cwd
+        root = str(Path(shapeguard.__file__).parents[1])
+        env = {**os.environ, "SHAPEGUARD_DISABLE": "1", "PYTHONPATH": root}
+        subprocess.run([sys.executable, "-c", code], env=env, cwd=root, check=True)
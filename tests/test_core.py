@@ -111,3 +111,16 @@ class TestUnificationContext:
         ctx = UnificationContext()
         n = Dim("n")
         assert ctx.get_binding_source(n) is None
+
+    def test_bind_with_index_formats_source(self):
+        """An index passed to bind() is appended to the source description."""
+        ctx = UnificationContext()
+        n = Dim("n")
+        ctx.bind(n, 42, "x", 1)
+        assert ctx.get_binding_source(n) == "x[1]"
+
+        with pytest.raises(UnificationError) as exc_info:
+            ctx.bind(n, 7, "y", 0)
+
+        assert exc_info.value.expected_source == "x[1]"
+        assert exc_info.value.actual_source == "y[0]"
@@ -16,6 +16,40 @@ from tests.conftest import requires_jax, requires_numpy
 class TestExpectsDecorator:
     """Tests for the @expects decorator."""
 
+    def test_reentrant_check_keeps_outer_bindings(self):
+        """A decorated call made while another call is checking is isolated."""
+        k = Dim("k")
+
+        @expects(x=(k,))
+        def inner(x):
+            return x
+
+        class Reentrant:
+            dtype = "float32"
+
+            def __init__(self, shape):
+                self._shape = shape
+
+            @property
+            def shape(self):
+                inner(Plain((7,)))  # Re-enters the checker on this thread
+                return self._shape
+
+        class Plain:
+            dtype = "float32"
+
+            def __init__(self, shape):
+                self.shape = shape
+
+        n = Dim("n")
+
+        @expects(a=(n,), b=(n,))
+        def outer(a, b):
+            return a, b
+
+        with pytest.raises(UnificationError):
+            outer(Plain((3,)), Reentrant((4,)))
+
     @requires_numpy
     def test_valid_shapes_pass(self, np_array):
         """Function executes normally when shapes match."""
@@ -5,7 +5,7 @@ Tests for ellipsis support in shape specs.
 import pytest
 
 from shapeguard import Dim, check_shape, expects
-from shapeguard.core import ELLIPSIS
+from shapeguard.core import ELLIPSIS, _EllipsisType
 from shapeguard.errors import DimensionMismatchError, RankMismatchError, UnificationError
 from shapeguard.spec import format_spec
 from tests.conftest import requires_numpy
@@ -142,6 +142,11 @@ class TestEllipsisSpec:
         assert format_spec((..., n, 10)) == "(..., n, 10)"
         assert format_spec((ELLIPSIS, n)) == "(..., n)"
 
+    def test_ellipsis_sentinel_is_singleton(self):
+        """Constructing the sentinel type returns ELLIPSIS itself."""
+        assert _EllipsisType() is ELLIPSIS
+        assert ELLIPSIS == ...
+
 
 class TestCheckShapeEllipsis:
     """Tests for check_shape with ellipsis."""
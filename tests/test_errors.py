@@ -2,6 +2,9 @@
 Tests for shapeguard.errors module.
 """
 
+import copy
+import pickle
+
 import pytest
 
 from shapeguard.core import Dim
@@ -55,6 +58,14 @@ class TestShapeGuardError:
         assert err.actual == (20,)
         assert err.reason == "mismatch"
 
+    def test_str_reflects_fields_set_after_first_str(self):
+        """str() stays current when fields are filled in after formatting."""
+        err = ShapeGuardError("test", reason="mismatch")
+        assert "function" not in str(err)
+
+        err.function = "late_fn"
+        assert "late_fn" in str(err)
+
 
 class TestUnificationError:
     """Tests for UnificationError."""
@@ -169,3 +180,55 @@ class TestErrorInheritance:
         for err in errors:
             with pytest.raises(ShapeGuardError):
                 raise err
+
+
+class TestErrorSerialization:
+    """Errors keep their diagnostic fields across pickle and copy."""
+
+    @pytest.mark.parametrize(
+        "roundtrip",
+        [
+            lambda e: pickle.loads(pickle.dumps(e)),
+            copy.copy,
+            copy.deepcopy,
+        ],
+    )
+    def test_base_error_roundtrip(self, roundtrip):
+        err = ShapeGuardError("m", function="f", argument="x", expected=(3,), actual=(4,))
+        restored = roundtrip(err)
+
+        assert restored.function == "f"
+        assert restored.argument == "x"
+        assert restored.expected == (3,)
+        assert str(restored) == str(err)
+
+    def test_subclass_pickle_roundtrip(self):
+        n = Dim("n")
+        err = UnificationError(
+            dim=n,
+            expected_value=3,
+            expected_source="x[0]",
+            actual_value=4,
+            actual_source="y[0]",
+            argument="y",
+        )
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert type(restored) is UnificationError
+        assert restored.expected_value == 3
+        assert restored.argument == "y"
+        assert str(restored) == str(err)
+
+    def test_dimension_mismatch_pickle_roundtrip(self):
+        err = DimensionMismatchError(
+            argument="x",
+            dim_index=1,
+            expected_value=4,
+            actual_value=5,
+            expected_shape=(3, 4),
+            actual_shape=(3, 5),
+        )
+        restored = pickle.loads(pickle.dumps(err))
+
+        assert type(restored) is DimensionMismatchError
+        assert str(restored) == str(err)
@@ -6,7 +6,7 @@ from unittest.mock import patch
 
 import pytest
 
-from shapeguard import Dim, config, expects
+from shapeguard import Dim, check_shape, config, expects
 from shapeguard._compat import is_jax_installed, is_jax_tracing
 from shapeguard.errors import DimensionMismatchError
 from tests.conftest import requires_jax, requires_numpy
@@ -25,6 +25,14 @@ class TestJitDetection:
         result = is_jax_installed()
         assert isinstance(result, bool)
 
+    def test_tracer_probe_resolved_after_first_call(self):
+        """The tracer probe is looked up once and then called directly."""
+        from shapeguard import _compat
+
+        is_jax_tracing()
+        assert _compat._tracer_probe is not _compat._bootstrap_tracer_probe
+        assert _compat._tracer_probe() is False
+
     @requires_jax
     def test_tracing_inside_jit(self, jax_array):
         """Inside JIT, is_jax_tracing returns True."""
@@ -210,6 +218,36 @@ class TestGlobalConfig:
             config.jit_mode = original
 
 
+class TestCheckShapeJitMode:
+    """Tests for check_shape under JAX tracing."""
+
+    @requires_numpy
+    def test_skip_mode_skips_when_tracing(self, np_array):
+        """check_shape is a no-op when tracing with global skip mode."""
+        original = config.jit_mode
+
+        try:
+            config.jit_mode = "skip"
+            n = Dim("n")
+
+            with patch("shapeguard._compat._tracer_probe", return_value=True):
+                ctx = check_shape(np_array((10, 64)), (n, 128), "x")
+
+            assert ctx.resolve(n) is None
+
+        finally:
+            config.jit_mode = original
+
+    @requires_numpy
+    def test_check_mode_validates_when_tracing(self, np_array):
+        """check_shape still validates when tracing in check mode."""
+        n = Dim("n")
+
+        with patch("shapeguard._compat._tracer_probe", return_value=True):
+            with pytest.raises(DimensionMismatchError):
+                check_shape(np_array((10, 64)), (n, 128), "x")
+
+
 class TestJitModeMetadata:
     """Tests for jit_mode metadata on decorated functions."""
 
@@ -8,9 +8,10 @@ from shapeguard.core import Dim, UnificationContext
 from shapeguard.errors import (
     DimensionMismatchError,
     RankMismatchError,
+    ShapeGuardError,
     UnificationError,
 )
-from shapeguard.spec import check_shape, format_spec, match_shape
+from shapeguard.spec import _compile_spec, check_shape, format_spec, match_shape
 from tests.conftest import requires_numpy
 
 
@@ -83,6 +84,104 @@ class TestMatchShape:
 
         assert ctx.resolve(n) == 5
 
+    def test_repeated_spec_binds_per_call(self):
+        """Reusing a (cached) spec still binds fresh values in each context."""
+        n = Dim("n")
+        spec = (n, 4)
+
+        ctx1 = UnificationContext()
+        match_shape((3, 4), spec, ctx1, "x")
+        ctx2 = UnificationContext()
+        match_shape((7, 4), spec, ctx2, "x")
+
+        assert ctx1.resolve(n) == 3
+        assert ctx2.resolve(n) == 7
+
+    def test_list_spec(self):
+        """Unhashable specs (lists) are still accepted."""
+        ctx = UnificationContext()
+        n = Dim("n")
+        match_shape((3, 4), [n, 4], ctx, "x")
+        assert ctx.resolve(n) == 3
+
+    def test_equal_spec_with_invalid_type_still_raises(self):
+        """A cached (3, 4) parse is not reused for the equal spec (3.0, 4)."""
+        ctx = UnificationContext()
+        match_shape((3, 4), (3, 4), ctx, "x")
+
+        with pytest.raises(TypeError):
+            match_shape((3, 4), (3.0, 4), ctx, "x")
+
+    def test_invalid_spec_element_raises(self):
+        """Spec elements other than int, Dim, None, or ... raise TypeError."""
+        ctx = UnificationContext()
+        with pytest.raises(TypeError, match="position 1"):
+            match_shape((3, 4), (3, "m"), ctx, "x")
+
+
+class TestCompileSpec:
+    """Tests for specialized matchers generated by _compile_spec."""
+
+    def test_binds_symbolic_dims(self):
+        n, m = Dim("n"), Dim("m")
+        ctx = UnificationContext()
+        _compile_spec((2, ..., n, None, m))((2, 7, 5, 9, 4), ctx, "x")
+
+        assert ctx.resolve(n) == 5
+        assert ctx.resolve(m) == 4
+        assert ctx.get_binding_source(n) == "x[2]"
+
+    @pytest.mark.parametrize(
+        ("spec", "actual"),
+        [
+            ((3, 4), (3, 5)),
+            ((3, 4), (3, 4, 5)),
+            (("n", 4), (3, 5)),
+            (("n", "n"), (3, 4)),
+            ((..., "n", 4), (4,)),
+            ((..., "n", 4), (2, 3, 5)),
+            ((1, ..., "n"), (2, 3)),
+        ],
+    )
+    def test_errors_match_match_shape(self, spec, actual):
+        """Compiled matchers raise exactly what match_shape raises."""
+        n = Dim("n")
+        spec = tuple(n if d == "n" else d for d in spec)
+
+        with pytest.raises(ShapeGuardError) as expected:
+            match_shape(actual, spec, UnificationContext(), "x")
+        with pytest.raises(ShapeGuardError) as compiled:
+            _compile_spec(spec)(actual, UnificationContext(), "x")
+
+        assert type(compiled.value) is type(expected.value)
+        assert str(compiled.value) == str(expected.value)
+
+    def test_list_spec(self):
+        n = Dim("n")
+        ctx = UnificationContext()
+        _compile_spec([n, 4])((3, 4), ctx, "x")
+        assert ctx.resolve(n) == 3
+
+    def test_errors_report_callers_spec(self):
+        """Equal specs compiled separately each report their own spec object."""
+        from shapeguard.core import ELLIPSIS
+
+        first, second = (2, ...), (2, ELLIPSIS)
+        _compile_spec(first)
+
+        with pytest.raises(ShapeGuardError) as exc_info:
+            _compile_spec(second)((3, 4), UnificationContext(), "x")
+        assert exc_info.value.expected is second
+
+    def test_equal_spec_with_invalid_type_still_raises(self):
+        _compile_spec((3, 4))
+        with pytest.raises(TypeError):
+            _compile_spec((3.0, 4))
+
+    def test_invalid_spec_raises_when_compiled(self):
+        with pytest.raises(TypeError):
+            _compile_spec((3, "m"))
+
 
 class TestCheckShape:
     """Tests for the check_shape standalone function."""
@@ -123,9 +222,24 @@ class TestCheckShape:
 
         ctx = check_shape(x, (n, 20), name="x")
 
-        with pytest.raises(UnificationError):
+        with pytest.raises(UnificationError) as exc_info:
             check_shape(y, (n, 30), name="y", ctx=ctx)
 
+        assert exc_info.value.argument == "y"
+
+    @requires_numpy
+    def test_check_shape_error_names_argument(self, np_array):
+        """Errors from check_shape carry the given name as their argument."""
+        x = np_array((10, 20))
+
+        with pytest.raises(DimensionMismatchError) as exc_info:
+            check_shape(x, (10, 30), name="input")
+        assert exc_info.value.argument == "input"
+
+        with pytest.raises(RankMismatchError) as exc_info:
+            check_shape(x, (10,), name="input")
+        assert exc_info.value.argument == "input"
+
     def test_check_shape_non_array_raises(self):
         """check_shape raises TypeError for non-array input."""
         with pytest.raises(TypeError):
@@ -150,5 +264,9 @@ class TestFormatSpec:
         n = Dim("batch")
         assert format_spec((n, 128, None)) == "(batch, 128, *)"
 
+    def test_format_list_spec(self):
+        n = Dim("n")
+        assert format_spec([n, 4]) == "(n, 4)"
+
     def test_format_empty(self):
         assert format_spec(()) == "()"